@@ -2,6 +2,18 @@
 from manim import *
 import numpy as np
 
+# ============================================
+# 第一部分的坐标系（ε-δ 场景复用）
+# ============================================
+def geometric_axes():
+    return Axes(
+        x_range=[-1, 3, 1],
+        y_range=[-1, 9, 2],
+        x_length=6,
+        y_length=5,
+        axis_config={"color": BLUE},
+    ).shift(DOWN * 0.5)
+
 # ============================================
 # SCENE 1: Geometric Definition of Derivative
 # 时长: 50秒
@@ -14,14 +26,9 @@ class Scene1_GeometricDefinition(ThreeDScene):
         self.play(Write(title))
         self.wait(1)
         
+        self.next_section("axes")
         # Part 2: Setup coordinate system
-        axes = Axes(
-            x_range=[-1, 3, 1],
-            y_range=[-1, 9, 2],
-            x_length=6,
-            y_length=5,
-            axis_config={"color": BLUE},
-        ).shift(DOWN * 0.5)
+        axes = geometric_axes()
         
         x_label = MathTex("x").next_to(axes.x_axis.get_right(), RIGHT)
         y_label = MathTex("y").next_to(axes.y_axis.get_top(), UP)
@@ -29,6 +36,7 @@ class Scene1_GeometricDefinition(ThreeDScene):
         self.play(Create(axes), Write(x_label), Write(y_label))
         self.wait(0.5)
         
+        self.next_section("graph")
         # Part 3: Function f(x) = x^2
         func = lambda x: x**2
         graph = axes.plot(func, x_range=[-0.5, 2.8], color=GREEN)
@@ -38,6 +46,7 @@ class Scene1_GeometricDefinition(ThreeDScene):
         self.play(Create(graph), Write(graph_label))
         self.wait(1)
         
+        self.next_section("point")
         # Part 4: Point at x = 1
         a = 1
         point_a = axes.coords_to_point(a, func(a))
@@ -48,6 +57,7 @@ class Scene1_GeometricDefinition(ThreeDScene):
         self.play(Create(dot_a), Write(dot_label))
         self.wait(1)
         
+        self.next_section("secants")
         # Part 5: Secant lines with different h values
         h_values = [2.0, 1.0, 0.5, 0.1]
         
@@ -76,6 +86,7 @@ class Scene1_GeometricDefinition(ThreeDScene):
             if i < len(h_values) - 1:
                 self.play(FadeOut(dot_b), FadeOut(secant), FadeOut(slope_text))
         
+        self.next_section("tangent")
         # Part 6: Tangent line as limit
         tangent_slope = 2 * a  # f'(x) = 2x, at x=1
         tangent = axes.plot(
@@ -91,6 +102,7 @@ class Scene1_GeometricDefinition(ThreeDScene):
         self.play(Transform(secant, tangent), Write(tangent_label))
         self.wait(1)
         
+        self.next_section("limit_definition")
         # Part 7: Limit definition
         limit_def = MathTex(
             r"f'(a) = \lim_{h \to 0} \frac{f(a+h) - f(a)}{h}",
@@ -102,6 +114,7 @@ class Scene1_GeometricDefinition(ThreeDScene):
         self.play(Write(limit_def))
         self.wait(2)
         
+        self.next_section("final")
         # Clean transition
         self.play(*[FadeOut(mob) for mob in self.mobjects])
         self.wait(0.5)
@@ -118,6 +131,7 @@ class Scene2_RateOfChange(Scene):
         self.play(Write(title))
         self.wait(1)
         
+        self.next_section("time_line")
         # Create number line for position
         time_line = NumberLine(
             x_range=[0, 10, 1],
@@ -150,6 +164,7 @@ class Scene2_RateOfChange(Scene):
         
         self.play(Create(pos_line), Write(pos_label))
         
+        self.next_section("positions")
         # Show points at different times
         times = [2, 4, 6, 8]
         positions = [pos_func(t) for t in times]
@@ -184,6 +199,7 @@ class Scene2_RateOfChange(Scene):
             
             self.wait(0.3)
         
+        self.next_section("average_velocity")
         # Average velocity calculation
         avg_velocity_text = VGroup(
             Tex(r"\text{Average Velocity: }"),
@@ -203,6 +219,7 @@ class Scene2_RateOfChange(Scene):
         self.play(Write(example_calc))
         self.wait(1)
         
+        self.next_section("instant_velocity")
         # Instantaneous velocity
         instant_text = VGroup(
             Tex(r"\text{Instantaneous Velocity: }"),
@@ -220,6 +237,7 @@ class Scene2_RateOfChange(Scene):
         self.play(Write(derivative_calc))
         self.wait(2)
         
+        self.next_section("final")
         # Clean transition
         self.play(*[FadeOut(mob) for mob in self.mobjects])
         self.wait(0.5)
@@ -236,6 +254,7 @@ class Scene3_Velocity(Scene):
         self.play(Write(title))
         self.wait(1)
         
+        self.next_section("axes")
         # Create coordinate system
         axes = Axes(
             x_range=[0, 6, 1],
@@ -262,6 +281,7 @@ class Scene3_Velocity(Scene):
         self.play(Create(s_graph), Write(s_label))
         self.wait(1)
         
+        self.next_section("velocity")
         # Velocity function v(t) = s'(t) = 2t
         v_axes = Axes(
             x_range=[0, 6, 1],
@@ -295,6 +315,7 @@ class Scene3_Velocity(Scene):
         self.play(Write(relation))
         self.wait(1)
         
+        self.next_section("tangents")
         # Animate a moving point with tangent
         t_values = [1, 2, 3, 4]
         
@@ -345,6 +366,7 @@ class Scene3_Velocity(Scene):
         
         self.wait(1)
         
+        self.next_section("summary")
         # Summary
         summary = MathTex(
             r"\text{Position } s(t) \rightarrow \text{Velocity } v(t) = s'(t) = \frac{ds}{dt}"
@@ -354,6 +376,7 @@ class Scene3_Velocity(Scene):
         self.play(Write(summary))
         self.wait(2)
         
+        self.next_section("final")
         # Clean transition
         self.play(*[FadeOut(mob) for mob in self.mobjects])
         self.wait(0.5)
@@ -370,6 +393,7 @@ class Scene4_SecondDerivative(Scene):
         self.play(Write(title))
         self.wait(1)
         
+        self.next_section("position")
         # Three graphs: Position → Velocity → Acceleration
         axes_config = {
             "x_range": [0, 6, 1],
@@ -392,6 +416,7 @@ class Scene4_SecondDerivative(Scene):
         self.play(Create(pos_axes), Write(pos_label), Create(pos_graph))
         self.wait(0.5)
         
+        self.next_section("velocity")
         # Velocity graph (first derivative)
         vel_axes = Axes(
             y_range=[-10, 10, 2],
@@ -407,6 +432,7 @@ class Scene4_SecondDerivative(Scene):
         self.play(Create(vel_axes), Write(vel_label), Create(vel_graph))
         self.wait(0.5)
         
+        self.next_section("acceleration")
         # Acceleration graph (second derivative)
         acc_axes = Axes(
             y_range=[-12, 12, 2],
@@ -422,6 +448,7 @@ class Scene4_SecondDerivative(Scene):
         self.play(Create(acc_axes), Write(acc_label), Create(acc_graph))
         self.wait(1)
         
+        self.next_section("derivative_chain")
         # Show derivative relationships
         derivative_chain = VGroup(
             MathTex(r"s(t) \xrightarrow{\frac{d}{dt}} v(t) \xrightarrow{\frac{d}{dt}} a(t)"),
@@ -433,6 +460,7 @@ class Scene4_SecondDerivative(Scene):
         self.play(Write(derivative_chain))
         self.wait(1)
         
+        self.next_section("critical_points")
         # Highlight critical points
         # Find when v(t) = 0
         t_critical = [1, 3]  # Solutions to 3t^2 - 12t + 9 = 0
@@ -461,6 +489,7 @@ class Scene4_SecondDerivative(Scene):
             )
             self.wait(0.5)
         
+        self.next_section("interpretation")
         # Physical interpretation
         interpretation = VGroup(
             Tex(r"$\bullet$ Velocity $v(t)$ = rate of change of position"),
@@ -475,6 +504,7 @@ class Scene4_SecondDerivative(Scene):
         self.play(Write(interpretation))
         self.wait(2)
         
+        self.next_section("final")
         # Clean transition
         self.play(*[FadeOut(mob) for mob in self.mobjects])
         self.wait(0.5)
@@ -491,6 +521,7 @@ class Scene5_Applications(Scene):
         self.play(Write(title))
         self.wait(1)
         
+        self.next_section("optimization")
         # Application 1: Optimization
         app1_title = Tex(r"\text{1. Optimization: Finding Maximum/Minimum}", color=BLUE)
         app1_title.to_edge(LEFT).shift(UP * 2)
@@ -522,6 +553,7 @@ class Scene5_Applications(Scene):
         self.play(Write(example1), Create(rect), Write(dimensions))
         self.wait(2)
         
+        self.next_section("related_rates")
         # Application 2: Related Rates
         self.play(FadeOut(example1), FadeOut(rect), FadeOut(dimensions))
         
@@ -556,6 +588,7 @@ class Scene5_Applications(Scene):
         )
         self.wait(2)
         
+        self.next_section("linear_approximation")
         # Application 3: Linear Approximation
         self.play(FadeOut(example2), FadeOut(sphere), FadeOut(radius_line), FadeOut(radius_label))
         
@@ -609,6 +642,7 @@ class Scene5_Applications(Scene):
         )
         self.wait(2)
         
+        self.next_section("summary")
         # Final summary
         summary = VGroup(
             Tex(r"\text{Derivatives are used in:}"),
@@ -624,6 +658,7 @@ class Scene5_Applications(Scene):
         self.play(Write(summary))
         self.wait(3)
         
+        self.next_section("final_equation")
         # Final equation
         final_eq = MathTex(
             r"\frac{df}{dx} = \lim_{h \to 0} \frac{f(x+h)-f(x)}{h}",
@@ -637,6 +672,8 @@ class Scene5_Applications(Scene):
             Write(final_eq)
         )
         self.wait(2)
+        
+        self.next_section("final")
 
 # ============================================
 # SCENE 6: All in One (Complete Summary)
@@ -650,6 +687,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(main_title))
         self.wait(1)
         
+        self.next_section("columns")
         # Three column layout
         column1 = VGroup(
             Tex(r"\textbf{Geometric:}"),
@@ -697,6 +735,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(column3))
         self.wait(2)
         
+        self.next_section("applications")
         # Applications box
         applications = VGroup(
             Tex(r"\textbf{Key Applications:}"),
@@ -713,6 +752,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(applications))
         self.wait(2)
         
+        self.next_section("symbol")
         # Final animation: derivative symbol
         derivative_symbol = MathTex(
             r"\frac{d}{dx}",
@@ -738,6 +778,7 @@ class Scene6_CompleteSummary(Scene):
             run_time=1.5
         )
         
+        self.next_section("final_message")
         # Final message
         final_message = Tex(
             r"\text{Derivatives: The mathematics of change}",
@@ -749,6 +790,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(final_message))
         self.wait(3)
         
+        self.next_section("final_equation")
         # Final equation
         final_eq = MathTex(
             r"\frac{df}{dx} = \lim_{h \to 0} \frac{f(x+h)-f(x)}{h}",
@@ -762,6 +804,8 @@ class Scene6_CompleteSummary(Scene):
             Write(final_eq)
         )
         self.wait(2)
+        
+        self.next_section("final")
 
 # ============================================
 # SCENE 6: All in One (Complete Summary)
@@ -775,6 +819,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(main_title))
         self.wait(1)
         
+        self.next_section("columns")
         # Three column layout
         column1 = VGroup(
             Tex(r"\textbf{Geometric:}"),
@@ -822,6 +867,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(column3))
         self.wait(2)
         
+        self.next_section("applications")
         # Applications box
         applications = VGroup(
             Tex(r"\textbf{Key Applications:}"),
@@ -838,6 +884,7 @@ class Scene6_CompleteSummary(Scene):
         self.play(Write(applications))
         self.wait(2)
         
+        self.next_section("symbol")
         # Final animation: derivative symbol
         derivative_symbol = MathTex(
             r"\frac{d}{dx}",
@@ -863,6 +910,7 @@ class Scene6_CompleteSummary(Scene):
             run_time=1.5
         )
         
+        self.next_section("final_message")
         # Final message
         final_message = Tex(
             r"\text{Derivatives: The mathematics of change}",
@@ -872,4 +920,258 @@ class Scene6_CompleteSummary(Scene):
         final_message.to_edge(DOWN, buff=0.5)
         
         self.play(Write(final_message))
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+        
+        self.next_section("final")
+
+# ============================================
+# ε-δ 表：对一组 ε 一次性算出对应的 δ
+# ============================================
+def epsilon_delta_table(func, a, limit, epsilons, max_delta=1.0, samples=4000):
+    # 在 0<|h|<=max_delta 上采样差商 (f(a+h)-f(a))/h，左右两侧一起算
+    h = np.linspace(max_delta / samples, max_delta, samples)
+    quotients = np.stack([
+        (func(a + h) - func(a)) / h,
+        (func(a - h) - func(a)) / -h,
+    ])
+    # worst[k]: |h| <= h[k] 范围内差商与极限的最大偏差，单调不减
+    worst = np.maximum.accumulate(np.abs(quotients - limit).max(axis=0))
+    # δ 取最后一个仍在界内的采样点：第一个 worst >= ε 的前一个；一开始就超出取 0，从未超出取 max_delta
+    index = np.searchsorted(worst, epsilons, side="left")
+    return np.concatenate(([0.0], h))[index]
+
+# ============================================
+# SCENE 7: ε-δ Definition of the Derivative
+# 时长: 22秒
+# ============================================
+class Scene7_EpsilonDelta(Scene):
+    func = staticmethod(lambda x: x**2)
+    a = 1
+    limit = 2  # f'(1) = 2
+
+    def construct(self):
+        # Title
+        title = Tex(r"Part 7: $\varepsilon$-$\delta$ Definition of the Derivative")
+        title.to_edge(UP, buff=0.5)
+        self.play(Write(title))
+        self.wait(1)
+
+        self.next_section("axes")
+        # Same axes as Scene 1, now showing the difference quotient against h
+        axes = geometric_axes()
+        h_label = MathTex("h").next_to(axes.x_axis.get_right(), RIGHT)
+        q_label = MathTex("q(h)").next_to(axes.y_axis.get_top(), UP)
+
+        self.play(Create(axes), Write(h_label), Write(q_label))
+        self.wait(0.5)
+
+        self.next_section("quotient")
+        func, a, limit = self.func, self.a, self.limit
+        quotient = lambda h: (func(a + h) - func(a)) / h
+        graph = axes.plot(quotient, x_range=[-0.9, 2.8], discontinuities=[0], color=GREEN)
+        hole = Circle(radius=0.06, color=GREEN, fill_color=BLACK, fill_opacity=1)
+        hole.move_to(axes.coords_to_point(0, limit))
+        graph_label = MathTex(r"q(h) = \frac{f(1+h)-f(1)}{h}", color=GREEN, font_size=36)
+        graph_label.to_edge(RIGHT).shift(UP * 1.5)
+
+        limit_line = DashedLine(
+            axes.coords_to_point(-1, limit), axes.coords_to_point(3, limit),
+            color=RED, stroke_width=2
+        )
+        limit_label = MathTex(r"f'(1) = 2", color=RED, font_size=32)
+        limit_label.next_to(limit_line, RIGHT)
+
+        self.play(Create(graph), FadeIn(hole), Write(graph_label))
+        self.play(Create(limit_line), Write(limit_label))
+        self.wait(0.5)
+
+        self.next_section("bands")
+        # δ for a dense grid of ε values, computed once up front
+        epsilons = np.linspace(0.02, 1.5, 2000)
+        deltas = epsilon_delta_table(func, a, limit, epsilons)
+        # 取不超过当前 ε 的最大网格点，显示的 δ 对当前 ε 一定成立
+        delta_at = lambda eps: deltas[max(np.searchsorted(epsilons, eps, side="right") - 1, 0)]
+
+        eps = ValueTracker(epsilons[-1])
+        x_min, x_max = axes.x_range[:2]
+
+        def band_corners(x0, x1, y0, y1):
+            corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+            return [axes.coords_to_point(x, y) for x, y in corners]
+
+        # Bands are reshaped in place every frame, never rebuilt
+        eps_band = Polygon(*band_corners(x_min, x_max, limit - 1, limit + 1)[:-1],
+                           stroke_width=0, fill_color=YELLOW, fill_opacity=0.2)
+        delta_band = Polygon(*band_corners(-1, 1, -1, 9)[:-1],
+                             stroke_width=0, fill_color=BLUE, fill_opacity=0.2)
+        limit_zone = Polygon(*band_corners(-1, 1, limit - 1, limit + 1)[:-1],
+                             color=ORANGE, stroke_width=2)
+
+        eps_band.add_updater(lambda m: m.set_points_as_corners(
+            band_corners(x_min, x_max, limit - eps.get_value(), limit + eps.get_value())))
+        delta_band.add_updater(lambda m: m.set_points_as_corners(
+            band_corners(-delta_at(eps.get_value()), delta_at(eps.get_value()), *axes.y_range[:2])))
+        limit_zone.add_updater(lambda m: m.set_points_as_corners(
+            band_corners(-delta_at(eps.get_value()), delta_at(eps.get_value()),
+                         limit - eps.get_value(), limit + eps.get_value())))
+
+        eps_value = DecimalNumber(eps.get_value(), num_decimal_places=3, color=YELLOW)
+        delta_value = DecimalNumber(delta_at(eps.get_value()), num_decimal_places=3, color=BLUE)
+        readout = VGroup(
+            VGroup(MathTex(r"\varepsilon =", color=YELLOW), eps_value).arrange(RIGHT),
+            VGroup(MathTex(r"\delta =", color=BLUE), delta_value).arrange(RIGHT),
+        ).arrange(DOWN, aligned_edge=LEFT)
+        readout.to_edge(RIGHT).shift(DOWN * 0.5)
+        eps_value.add_updater(lambda m: m.set_value(eps.get_value()))
+        delta_value.add_updater(lambda m: m.set_value(delta_at(eps.get_value())))
+
+        self.play(FadeIn(eps_band), FadeIn(delta_band), Create(limit_zone), Write(readout))
+        self.wait(0.5)
+
+        self.next_section("shrinking")
+        self.play(eps.animate.set_value(epsilons[0]), run_time=8, rate_func=smooth)
+        self.wait(1)
+
+        self.next_section("definition")
+        definition = MathTex(
+            r"\forall \varepsilon > 0\ \exists \delta > 0:\ 0<|h|<\delta \Rightarrow"
+            r"\left|\frac{f(1+h)-f(1)}{h} - f'(1)\right| < \varepsilon",
+            font_size=32
+        )
+        definition.to_edge(DOWN, buff=0.3)
+
+        self.play(Write(definition))
+        self.wait(2)
+
+        self.next_section("final")
+        # Clean transition
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.wait(0.5)
+
+# ============================================
+# 微分表：对一组 dx 一次性算出 dy、Δy 和误差
+# ============================================
+def differential_table(func, a, slope, dxs):
+    dy = slope * dxs
+    delta_y = func(a + dxs) - func(a)
+    return dy, delta_y, np.abs(delta_y - dy)
+
+# ============================================
+# SCENE 8: Differential dy vs. Increment Δy
+# 时长: 25秒
+# ============================================
+class Scene8_Differentials(Scene):
+    func = staticmethod(lambda x: x**2)
+    a = 1
+    slope = 2  # f'(1) = 2
+
+    def construct(self):
+        # Title
+        title = Tex(r"Part 8: Differential $dy$ vs. Increment $\Delta y$")
+        title.to_edge(UP, buff=0.5)
+        self.play(Write(title))
+        self.wait(1)
+
+        self.next_section("setup")
+        func, a, slope = self.func, self.a, self.slope
+        fa = func(a)
+
+        # dx from 1 down to 0.001, sampled evenly in log scale
+        dxs = np.geomspace(1e-3, 1, 3000)
+        log_dxs = np.log10(dxs)
+        dy, delta_y, error = differential_table(func, a, slope, dxs)
+        log_error = np.log10(np.maximum(error, 1e-12))
+
+        # Left: function, tangent and the dx / dy / Δy segments
+        axes = geometric_axes().scale(0.7).to_edge(LEFT, buff=0.5).shift(DOWN * 0.8)
+        graph = axes.plot(func, x_range=[-0.5, 2.8], color=GREEN)
+        tangent = axes.plot(lambda x: slope * (x - a) + fa, x_range=[a - 1, a + 1.5], color=RED)
+        point_a = axes.coords_to_point(a, fa)
+        dot_a = Dot(point_a, color=WHITE, radius=0.06)
+
+        self.play(Create(axes), Create(graph), Create(tangent), Create(dot_a))
+        self.wait(0.5)
+
+        # Right: log-log plot of the approximation error, drawn once from the table
+        error_axes = Axes(
+            x_range=[np.floor(log_dxs.min()), np.ceil(log_dxs.max()), 1],
+            y_range=[np.floor(log_error.min()), np.ceil(log_error.max()), 1],
+            x_length=4.5,
+            y_length=3.5,
+            axis_config={"color": BLUE, "include_numbers": True, "font_size": 20},
+        ).to_edge(RIGHT, buff=0.7).shift(DOWN * 0.8)
+        error_labels = error_axes.get_axis_labels(
+            MathTex(r"\log_{10} dx", font_size=24),
+            MathTex(r"\log_{10} |\Delta y - dy|", font_size=24)
+        )
+        error_curve = error_axes.plot_line_graph(
+            log_dxs, log_error, line_color=ORANGE, add_vertex_dots=False, stroke_width=2
+        )
+
+        self.play(Create(error_axes), Write(error_labels), Create(error_curve), run_time=2)
+        self.wait(0.5)
+
+        self.next_section("shrinking")
+        # Each frame looks up one precomputed row; the per-frame cost does not depend on len(dxs)
+        log_dx = ValueTracker(log_dxs[-1])
+        row = lambda: min(np.searchsorted(log_dxs, log_dx.get_value()), len(dxs) - 1)
+
+        def corner_c():
+            i = row()
+            return axes.coords_to_point(a + dxs[i], fa)
+
+        def point_c():
+            i = row()
+            return axes.coords_to_point(a + dxs[i], fa + dy[i])
+
+        def point_b():
+            i = row()
+            return axes.coords_to_point(a + dxs[i], fa + delta_y[i])
+
+        dx_line = Line(point_a, corner_c(), color=BLUE, stroke_width=3)
+        dy_line = Line(corner_c(), point_c(), color=YELLOW, stroke_width=3)
+        error_line = Line(point_c(), point_b(), color=RED, stroke_width=4)
+        dot_c = Dot(point_c(), color=YELLOW, radius=0.05)
+        dot_b = Dot(point_b(), color=GREEN, radius=0.05)
+        error_dot = Dot(error_axes.coords_to_point(log_dxs[-1], log_error[-1]), color=RED, radius=0.06)
+
+        dx_line.add_updater(lambda m: m.set_points_as_corners([point_a, corner_c()]))
+        dy_line.add_updater(lambda m: m.set_points_as_corners([corner_c(), point_c()]))
+        error_line.add_updater(lambda m: m.set_points_as_corners([point_c(), point_b()]))
+        dot_c.add_updater(lambda m: m.move_to(point_c()))
+        dot_b.add_updater(lambda m: m.move_to(point_b()))
+        error_dot.add_updater(lambda m: m.move_to(
+            error_axes.coords_to_point(log_dxs[row()], log_error[row()])))
+
+        values = [
+            (r"dx =", BLUE, lambda: dxs[row()]),
+            (r"dy = f'(a)\,dx =", YELLOW, lambda: dy[row()]),
+            (r"\Delta y = f(a+dx)-f(a) =", GREEN, lambda: delta_y[row()]),
+            (r"|\Delta y - dy| =", RED, lambda: error[row()]),
+        ]
+        readout = VGroup()
+        for tex, color, value in values:
+            number = DecimalNumber(value(), num_decimal_places=6, color=color, font_size=28)
+            number.add_updater(lambda m, value=value: m.set_value(value()))
+            readout.add(VGroup(MathTex(tex, color=color, font_size=28), number).arrange(RIGHT))
+        readout.arrange_in_grid(rows=2, cols=2, buff=(0.6, 0.2), col_alignments="ll").scale(0.8)
+        readout.next_to(title, DOWN)
+
+        self.play(
+            Create(dx_line), Create(dy_line), Create(error_line),
+            FadeIn(dot_c), FadeIn(dot_b), FadeIn(error_dot), Write(readout)
+        )
+        self.play(log_dx.animate.set_value(log_dxs[0]), run_time=10, rate_func=linear)
+        self.wait(1)
+
+        self.next_section("summary")
+        summary = MathTex(r"\Delta y - dy = O(dx^2)\quad \Rightarrow \quad \Delta y \approx dy", color=YELLOW)
+        summary.to_edge(DOWN, buff=0.3)
+
+        self.play(Write(summary))
+        self.wait(2)
+
+        self.next_section("final")
+        # Clean transition
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.wait(0.5)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+import argparse
+import ast
+import asyncio
+import hashlib
+import io
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import av
+import websockets
+from PIL import Image
+from manim import Scene, config, logger, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.exceptions import EndSceneEarlyException
+
+from render_pipeline import make_renderer
+
+# 预览质量；开启缓存，未变化的动画（manim 的播放哈希相同）直接复用分段视频
+PREVIEW_CONFIG = {
+    "quality": "low_quality",
+    "disable_caching": False,
+    "write_to_movie": True,
+    "preview": False,
+}
+
+PAGE = """<!doctype html>
+<meta charset="utf-8">
+<title>derivative_series preview</title>
+<body style="margin:0;background:#111;color:#ccc;font-family:sans-serif">
+<div id="status">connecting...</div>
+<img id="frame" style="max-width:100vw">
+<script>
+const img = document.getElementById("frame");
+const status = document.getElementById("status");
+const ws = new WebSocket(`ws://${location.hostname}:WS_PORT`);
+ws.onmessage = (event) => {
+    if (typeof event.data === "string") {
+        status.textContent = event.data;
+        return;
+    }
+    const url = URL.createObjectURL(event.data);
+    img.onload = () => URL.revokeObjectURL(url);
+    img.src = url;
+};
+ws.onclose = () => { status.textContent = "disconnected"; };
+</script>
+"""
+
+# ============================================
+# 按类重新导入：只执行指纹变化的 class 定义
+# ============================================
+def fingerprint(nodes, extra=""):
+    # ast.dump 不含注释与行号，只改注释或空行不会触发重新渲染
+    dumped = "".join(ast.dump(node) for node in nodes)
+    return hashlib.sha256((dumped + extra).encode()).hexdigest()
+
+
+class SceneLoader:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.base_fingerprint = None
+        self.fingerprints = {}
+        self.namespace = {}
+
+    def reload(self):
+        # 返回需要重新渲染的 Scene 类
+        tree = ast.parse(self.path.read_text(encoding="utf-8"), filename=str(self.path))
+        base = [node for node in tree.body if not isinstance(node, ast.ClassDef)]
+        classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+
+        # 导入、常量和辅助函数变了，所有类都要重新执行
+        base_fingerprint = fingerprint(base)
+        if base_fingerprint != self.base_fingerprint:
+            self.namespace = {"__name__": self.path.stem, "__file__": str(self.path)}
+            self._exec(base)
+            self.base_fingerprint = base_fingerprint
+            self.fingerprints = {}
+
+        # 基类的指纹计入子类，父场景改动时子场景也会重新渲染；重名的类以最后一个定义为准
+        fingerprints = {}
+        for node in classes:
+            bases = "".join(fingerprints.get(ast.unparse(b), "") for b in node.bases)
+            fingerprints[node.name] = fingerprint([node], bases)
+        changed = [name for name, value in fingerprints.items() if self.fingerprints.get(name) != value]
+
+        self._exec([node for node in classes if node.name in changed])
+        self.fingerprints = fingerprints
+        return [
+            self.namespace[name] for name in changed
+            if isinstance(self.namespace[name], type) and issubclass(self.namespace[name], Scene)
+        ]
+
+    def _exec(self, nodes):
+        code = compile(ast.Module(body=nodes, type_ignores=[]), str(self.path), "exec")
+        exec(code, self.namespace)
+
+# ============================================
+# 预览渲染：帧直接交给回调，可在任意一帧取消
+# ============================================
+class PreviewRenderer(CairoRenderer):
+    def __init__(self, *args, cancelled=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cancelled = cancelled
+
+    def render(self, scene, time, moving_mobjects):
+        # 过期的渲染在下一帧就停下，不等这段动画播完
+        if self.cancelled.is_set():
+            raise EndSceneEarlyException()
+        super().render(scene, time, moving_mobjects)
+
+    def scene_finished(self, scene):
+        # 被取消时既不合并视频，也不按“没有动画”去保存最后一帧
+        if self.cancelled.is_set():
+            self.file_writer.discard_partial_movie()
+            return
+        super().scene_finished(scene)
+
+
+class PreviewFileWriter(SceneFileWriter):
+    def __init__(self, renderer, scene_name, on_frame=None, cancelled=None, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.on_frame = on_frame
+        self.cancelled = cancelled
+        self.stream_open = False
+
+    def open_partial_movie_stream(self, file_path=None):
+        super().open_partial_movie_stream(file_path)
+        self.stream_open = True
+
+    def close_partial_movie_stream(self):
+        super().close_partial_movie_stream()
+        self.stream_open = False
+
+    def discard_partial_movie(self):
+        # 写了一半的分段以动画哈希命名，留着会被当成缓存复用
+        if self.stream_open:
+            self.close_partial_movie_stream()
+            Path(self.partial_movie_file_path).unlink(missing_ok=True)
+
+    def add_partial_movie_file(self, hash_animation):
+        # 每次 play 开始时调用，上一段分段视频已经关闭，在这里取消最干净
+        if self.cancelled.is_set():
+            raise EndSceneEarlyException()
+        super().add_partial_movie_file(hash_animation)
+        if hash_animation is not None and self.renderer.skip_animations:
+            # 命中缓存：解码已有的分段视频，不重新光栅化
+            with av.open(self.partial_movie_files[-1]) as container:
+                for frame in container.decode(video=0):
+                    if self.cancelled.is_set():
+                        raise EndSceneEarlyException()
+                    self.on_frame(frame.to_ndarray(format="rgb24"), 1)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        super().write_frame(frame_or_renderer, num_frames)
+        if not self.cancelled.is_set():
+            self.on_frame(frame_or_renderer, num_frames)
+
+
+def render_preview(scene_class, on_frame, cancelled):
+    with tempconfig(PREVIEW_CONFIG):
+        writer_class = partial(PreviewFileWriter, on_frame=on_frame, cancelled=cancelled)
+        renderer = make_renderer(scene_class, writer_class, PreviewRenderer, cancelled=cancelled)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+
+
+def encode_jpeg(frame):
+    buffer = io.BytesIO()
+    Image.fromarray(frame).convert("RGB").save(buffer, format="JPEG", quality=80)
+    return buffer.getvalue()
+
+# ============================================
+# asyncio 调度：文件再次变化时取消过期的渲染
+# ============================================
+class PreviewServer:
+    def __init__(self, path, scene_names=(), host="localhost", port=8000, poll_interval=0.3):
+        self.loader = SceneLoader(path)
+        self.scene_names = set(scene_names)
+        self.host = host
+        self.port = port
+        self.poll_interval = poll_interval
+        self.clients = set()
+        self.status = "waiting for changes"
+        self.frames = asyncio.Queue()
+        self.generation = 0
+        self.cancelled = threading.Event()
+        self.render_task = None
+
+    def broadcast(self, message):
+        self.status = message
+        websockets.broadcast(self.clients, message)
+
+    async def handle_client(self, websocket, path=None):
+        self.clients.add(websocket)
+        try:
+            await websocket.send(self.status)
+            await websocket.wait_closed()
+        finally:
+            self.clients.discard(websocket)
+
+    async def watch(self):
+        mtime = None
+        while True:
+            try:
+                current = self.loader.path.stat().st_mtime_ns
+            except OSError:
+                # 编辑器按“写临时文件再改名”保存时，文件会短暂不存在
+                current = mtime
+            if current != mtime:
+                mtime = current
+                try:
+                    changed = self.loader.reload()
+                except Exception as error:
+                    self.broadcast(f"error: {error!r}")
+                    changed = []
+                if self.scene_names:
+                    changed = [cls for cls in changed if cls.__name__ in self.scene_names]
+                if changed:
+                    await self.schedule(changed)
+            await asyncio.sleep(self.poll_interval)
+
+    async def schedule(self, scene_classes):
+        if self.render_task is not None and not self.render_task.done():
+            self.cancelled.set()
+            await self.render_task
+        # 新一代的帧；旧渲染残留在队列里的帧会被丢弃
+        self.generation += 1
+        self.cancelled = threading.Event()
+        self.render_task = asyncio.create_task(self.render(scene_classes, self.generation, self.cancelled))
+
+    async def render(self, scene_classes, generation, cancelled):
+        loop = asyncio.get_running_loop()
+
+        def on_frame(frame, num_frames):
+            item = (generation, config.frame_rate, num_frames, encode_jpeg(frame))
+            loop.call_soon_threadsafe(self.frames.put_nowait, item)
+
+        for scene_class in scene_classes:
+            if cancelled.is_set():
+                return
+            self.broadcast(f"rendering {scene_class.__name__}")
+            try:
+                # manim 的 config 是全局的，同一时间只跑一个渲染线程
+                await asyncio.to_thread(render_preview, scene_class, on_frame, cancelled)
+            except Exception as error:
+                logger.exception(error)
+                self.broadcast(f"{scene_class.__name__} failed: {error!r}")
+                return
+        if not cancelled.is_set():
+            self.broadcast(f"rendered {', '.join(cls.__name__ for cls in scene_classes)}")
+
+    async def stream(self):
+        # 按帧率推送，缓存解码出来的帧不会一下子全部涌到浏览器
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            generation, fps, num_frames, data = await self.frames.get()
+            if generation != self.generation:
+                continue
+            await asyncio.sleep(max(next_at - loop.time(), 0))
+            websockets.broadcast(self.clients, data)
+            next_at = max(next_at, loop.time()) + num_frames / fps
+
+    def serve_page(self):
+        page = PAGE.replace("WS_PORT", str(self.port + 1)).encode()
+
+        class PageHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.end_headers()
+                self.wfile.write(page)
+
+            def log_message(self, *args):
+                pass
+
+        http = ThreadingHTTPServer((self.host, self.port), PageHandler)
+        threading.Thread(target=http.serve_forever, daemon=True).start()
+
+    async def run(self):
+        self.serve_page()
+        async with websockets.serve(self.handle_client, self.host, self.port + 1):
+            logger.info(f"Preview at http://{self.host}:{self.port}")
+            await asyncio.gather(self.watch(), self.stream())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live preview of derivative_series.py with hot reload")
+    parser.add_argument("scenes", nargs="*", help="only preview these scenes")
+    parser.add_argument("--file", default=Path(__file__).with_name("derivative_series.py"))
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    asyncio.run(PreviewServer(args.file, args.scenes, args.host, args.port).run())
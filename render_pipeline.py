@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+import argparse
+import importlib
+import inspect
+import math
+import os
+import shutil
+import tempfile
+from functools import lru_cache, partial
+from pathlib import Path
+from queue import Queue
+from threading import Lock, Thread
+
+import av
+import numpy as np
+from PIL import GifImagePlugin, Image
+from manim import BLUE, GREEN, ORANGE, RED, WHITE, YELLOW, ManimColor, config, logger, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+
+# ============================================
+# 场景加载与渲染器构造
+# ============================================
+def load_scene(name, module="derivative_series"):
+    return getattr(importlib.import_module(module), name)
+
+
+def make_renderer(scene_class, file_writer_class=SceneFileWriter, renderer_class=CairoRenderer, **kwargs):
+    # Scene 只在未传入 renderer 时才按自己的 camera_class 构造渲染器，
+    # 这里沿用场景声明的默认相机（ThreeDScene 需要 ThreeDCamera）
+    camera_class = inspect.signature(scene_class.__init__).parameters["camera_class"].default
+    return renderer_class(
+        file_writer_class=file_writer_class,
+        camera_class=camera_class,
+        skip_animations=config.skip_animations,
+        **kwargs,
+    )
+
+# ============================================
+# 帧缓冲池：固定数量的整帧缓冲循环使用
+# ============================================
+class FramePool:
+    def __init__(self, shape, dtype=np.uint8, size=8, memmap_dir=None):
+        if memmap_dir is None:
+            storage = np.empty((size, *shape), dtype=dtype)
+        else:
+            self.file = tempfile.TemporaryFile(dir=memmap_dir)
+            storage = np.memmap(self.file, dtype=dtype, mode="w+", shape=(size, *shape))
+        self.free = Queue()
+        for buffer in storage:
+            self.free.put(buffer)
+        # 一帧可能同时交给主编码器和多个附加格式，全部用完才回到空闲队列
+        self.users = {}
+        self.lock = Lock()
+
+    def acquire(self):
+        # 所有缓冲都在编码队列里时阻塞，光栅化自然等待编码
+        buffer = self.free.get()
+        with self.lock:
+            self.users[id(buffer)] = 1
+        return buffer
+
+    def retain(self, buffer, count=1):
+        with self.lock:
+            self.users[id(buffer)] += count
+
+    def release(self, buffer):
+        with self.lock:
+            self.users[id(buffer)] -= 1
+            if self.users[id(buffer)]:
+                return
+            del self.users[id(buffer)]
+        self.free.put(buffer)
+
+
+class PooledCairoRenderer(CairoRenderer):
+    def __init__(self, *args, pool_size=8, memmap_dir=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_size = pool_size
+        self.memmap_dir = memmap_dir
+        self.frame_pool = None
+
+    def render(self, scene, time, moving_mobjects):
+        # 跳过 get_frame 的整帧分配，add_frame 直接拷进池里的缓冲
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        if self.frame_pool is None:
+            self.frame_pool = FramePool(frame.shape, frame.dtype, self.pool_size, self.memmap_dir)
+        buffer = self.frame_pool.acquire()
+        np.copyto(buffer, frame)
+        super().add_frame(buffer, num_frames)
+
+
+class PooledFileWriter(SceneFileWriter):
+    # 渲染器没有帧缓冲池时与 SceneFileWriter 完全相同
+    @property
+    def frame_pool(self):
+        return getattr(self.renderer, "frame_pool", None)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        super().write_frame(frame_or_renderer, num_frames)
+        if self.frame_pool is not None and not write_to_movie():
+            self.frame_pool.release(frame_or_renderer)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        super().encode_and_write_frame(frame, num_frames)
+        if self.frame_pool is not None:
+            self.frame_pool.release(frame)
+
+# ============================================
+# 帧输出：每种格式一个后台线程
+# ============================================
+class FrameSink:
+    def __init__(self, path, max_pending=32, deterministic=False):
+        self.path = Path(path)
+        self.deterministic = deterministic
+        self.error = None
+        # 有界队列：编码跟不上时阻塞光栅化，而不是无限堆积帧
+        self.queue = Queue(maxsize=max_pending)
+        self.thread = Thread(target=self._consume, daemon=True)
+        self.thread.start()
+
+    def put(self, frame, num_frames=1, release=None):
+        self.queue.put((frame, num_frames, release))
+
+    def close(self):
+        self.queue.put(None)
+
+    def join(self):
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _consume(self):
+        try:
+            while (item := self.queue.get()) is not None:
+                frame, num_frames, release = item
+                self.write(frame, num_frames)
+                if release is not None:
+                    release(frame)
+            self.finish()
+        except Exception as error:
+            self.error = error
+            # 继续清空队列并归还缓冲，避免光栅化一侧卡在缓冲池上
+            while (item := self.queue.get()) is not None:
+                if item[2] is not None:
+                    item[2](item[0])
+
+    def write(self, frame, num_frames):
+        raise NotImplementedError
+
+    def finish(self):
+        pass
+
+
+class VideoSink(FrameSink):
+    def __init__(self, path, codec, pix_fmt="yuv420p", options=None, **kwargs):
+        self.codec = codec
+        self.pix_fmt = pix_fmt
+        self.options = options or {}
+        self.container = None
+        super().__init__(path, **kwargs)
+
+    def write(self, frame, num_frames):
+        if self.container is None:
+            options = BITEXACT_CONTAINER_OPTIONS if self.deterministic else {}
+            self.container = av.open(str(self.path), mode="w", options=options)
+            # 与 manim 的分段视频用同一个时间基，附加格式不会与主输出漂移
+            rate = to_av_frame_rate(config.frame_rate)
+            self.stream = self.container.add_stream(self.codec, rate=rate, options=self.options)
+            self.stream.pix_fmt = self.pix_fmt
+            self.stream.height, self.stream.width = frame.shape[:2]
+            if self.deterministic:
+                self.stream.codec_context.thread_count = 1
+        for _ in range(num_frames):
+            # 与 SceneFileWriter 一致：VideoFrame 不能跨 encode 复用
+            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            for packet in self.stream.encode(av_frame):
+                self.container.mux(packet)
+
+    def finish(self):
+        if self.container is None:
+            return
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+class PngSequenceSink(FrameSink):
+    def __init__(self, path, **kwargs):
+        self.index = 0
+        super().__init__(path, **kwargs)
+
+    def write(self, frame, num_frames):
+        self.path.mkdir(parents=True, exist_ok=True)
+        first = self._frame_path(self.index)
+        Image.fromarray(frame).save(first)
+        # 静止画面（wait）一次会送来很多相同帧，只编码一次，其余用硬链接
+        for i in range(1, num_frames):
+            try:
+                os.link(first, self._frame_path(self.index + i))
+            except OSError:
+                shutil.copyfile(first, self._frame_path(self.index + i))
+        self.index += num_frames
+
+    def _frame_path(self, index):
+        return self.path / f"{self.path.name}{index:05d}.png"
+
+
+GIF_PALETTE_COLORS = (WHITE, BLUE, GREEN, RED, YELLOW, ORANGE)
+
+
+@lru_cache(maxsize=None)
+def gif_palette(background):
+    # 场景只用少数几种颜色画在纯色背景上，抗锯齿边缘是颜色到背景的渐变，
+    # 所以每种颜色取一条到背景色的渐变就足够；调色板只算一次，所有帧共用
+    bg = np.array(ManimColor(background).to_int_rgb(), dtype=float)
+    levels = (256 - 1) // len(GIF_PALETTE_COLORS)
+    ramp = np.linspace(0, 1, levels + 1)[1:, None]
+    entries = [bg[None, :]]
+    for color in GIF_PALETTE_COLORS:
+        rgb = np.array(ManimColor(color).to_int_rgb(), dtype=float)
+        entries.append(bg + (rgb - bg) * ramp)
+    entries = np.concatenate(entries).round().astype(np.uint8)
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    palette[:len(entries)] = entries
+    image = Image.new("P", (1, 1))
+    image.putpalette(palette.flatten().tolist())
+    return image
+
+
+class GifSink(FrameSink):
+    def __init__(self, path, fps=20, scale=0.5, **kwargs):
+        self.fps = fps
+        self.scale = scale
+        self.file = None
+        self.source_frames = 0
+        super().__init__(path, **kwargs)
+
+    def write(self, frame, num_frames):
+        # 按 fps 抽帧：只保留落在预览时间格点上的源帧
+        step = config.frame_rate / self.fps
+        first = math.ceil(self.source_frames / step)
+        last = math.ceil((self.source_frames + num_frames) / step)
+        self.source_frames += num_frames
+        if last <= first:
+            return
+        image = Image.fromarray(frame).convert("RGB")
+        if self.scale != 1:
+            size = (round(image.width * self.scale), round(image.height * self.scale))
+            image = image.resize(size, Image.Resampling.BILINEAR)
+        palette = gif_palette(ManimColor(config.background_color).to_hex())
+        image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+        # 边编码边写：所有帧共用同一个全局调色板，内存里不保留已写出的帧
+        if self.file is None:
+            self.file = open(self.path, "wb")
+            header, _ = GifImagePlugin.getheader(image, info={"loop": 0})
+            self.file.writelines(header)
+        duration = round((last - first) * 1000 / self.fps)
+        self.file.writelines(GifImagePlugin.getdata(image, duration=duration))
+
+    def finish(self):
+        if self.file is None:
+            return
+        self.file.write(b";")
+        self.file.close()
+
+
+SINK_FACTORIES = {
+    "mp4": lambda base, **kwargs: VideoSink(base.with_suffix(".mp4"), "libx264", options={"crf": "23"}, **kwargs),
+    "webm": lambda base, **kwargs: VideoSink(
+        base.with_suffix(".webm"), "libvpx-vp9", options={"crf": "32", "b:v": "0"}, **kwargs
+    ),
+    "png": lambda base, **kwargs: PngSequenceSink(base.parent / f"{base.stem}_frames", **kwargs),
+    "gif": lambda base, **kwargs: GifSink(base.with_suffix(".gif"), **kwargs),
+}
+
+# ============================================
+# 一次光栅化，多格式输出
+# ============================================
+class MultiFormatFileWriter(PooledFileWriter):
+    deterministic = False
+
+    def __init__(self, renderer, scene_name, formats=("webm", "gif"), **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.sinks = []
+        if write_to_movie():
+            base = Path(self.movie_file_path)
+            for fmt in formats:
+                # 主格式仍由 manim 自己的分段写入与合并负责
+                if f".{fmt}" == config.movie_file_extension:
+                    continue
+                self.sinks.append(SINK_FACTORIES[fmt](base, deterministic=self.deterministic))
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        release = None
+        if self.sinks and self.frame_pool is not None:
+            self.frame_pool.retain(frame_or_renderer, len(self.sinks))
+            release = self.frame_pool.release
+        super().write_frame(frame_or_renderer, num_frames)
+        for sink in self.sinks:
+            sink.put(frame_or_renderer, num_frames, release)
+
+    def finish(self):
+        for sink in self.sinks:
+            sink.close()
+        super().finish()
+        for sink in self.sinks:
+            sink.join()
+            logger.info(f"Additional output written to {sink.path}")
+
+
+def render_multi_format(scene_class, formats=("webm", "gif"), deterministic=False, pool_size=None,
+                        memmap_dir=None, **config_overrides):
+    # 命中缓存的动画不会重新光栅化，附加格式会缺帧，所以关闭缓存；
+    # 确定性输出同样依赖这一点，否则会拼进以前多线程编码的分段
+    with tempconfig({"disable_caching": True, **config_overrides}):
+        writer_class = DeterministicMultiFormatFileWriter if deterministic else MultiFormatFileWriter
+        writer_class = partial(writer_class, formats=formats)
+        if pool_size:
+            renderer = make_renderer(scene_class, writer_class, PooledCairoRenderer,
+                                     pool_size=pool_size, memmap_dir=memmap_dir)
+        else:
+            renderer = make_renderer(scene_class, writer_class)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+    return scene
+
+
+# ============================================
+# 确定性输出：相同场景与参数总是得到相同字节
+# ============================================
+# 容器不写 Lavf 版本号、creation_time 等元数据
+BITEXACT_CONTAINER_OPTIONS = {"fflags": "+bitexact"}
+REMUX_SUFFIXES = {".mp4", ".mov", ".webm"}
+
+
+def remux_bitexact(path):
+    # 只重新封装不重新编码：丢掉 manim 写入的注释元数据，时间戳按原顺序照抄
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.stem}.bitexact{path.suffix}")
+    with av.open(str(path)) as source, av.open(str(tmp_path), mode="w", options=BITEXACT_CONTAINER_OPTIONS) as target:
+        streams = {
+            stream.index: target.add_stream(template=stream)
+            for stream in source.streams
+            if stream.type in ("video", "audio")
+        }
+        for packet in source.demux(*[source.streams[index] for index in streams]):
+            if packet.dts is None:
+                continue
+            packet.stream = streams[packet.stream.index]
+            target.mux(packet)
+    os.replace(tmp_path, path)
+
+
+class DeterministicFileWriter(PooledFileWriter):
+    deterministic = True
+
+    def open_partial_movie_stream(self, file_path=None):
+        super().open_partial_movie_stream(file_path)
+        # 多线程编码的切片随 CPU 核数变化，x264 还会把线程数写进码流，固定为单线程；
+        # 编码器在第一帧到来时才打开，这里修改仍然生效
+        self.video_stream.codec_context.thread_count = 1
+
+    def combine_to_movie(self):
+        # 只对本次单线程编码的分段有效，须配合 disable_caching（见 render_multi_format）
+        super().combine_to_movie()
+        movie = Path(self.movie_file_path)
+        if movie.suffix in REMUX_SUFFIXES and movie.exists():
+            remux_bitexact(movie)
+
+
+class DeterministicMultiFormatFileWriter(DeterministicFileWriter, MultiFormatFileWriter):
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render scenes from derivative_series.py once and encode several formats")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument("--formats", nargs="+", default=["webm", "gif"], choices=sorted(SINK_FACTORIES))
+    parser.add_argument("--quality", default="high_quality")
+    parser.add_argument("--deterministic", action="store_true", help="byte-identical output for unchanged scenes")
+    parser.add_argument("--pool-size", type=int, help="reuse this many preallocated frame buffers")
+    parser.add_argument("--memmap-dir", help="back the frame buffers with a memory-mapped file in this directory")
+    args = parser.parse_args()
+
+    for name in args.scenes:
+        render_multi_format(
+            load_scene(name),
+            formats=args.formats,
+            deterministic=args.deterministic,
+            pool_size=args.pool_size,
+            memmap_dir=args.memmap_dir,
+            quality=args.quality,
+        )
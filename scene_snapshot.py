@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+import argparse
+from pathlib import Path
+
+from manim import config, logger, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.exceptions import EndSceneEarlyException
+
+from render_pipeline import load_scene, make_renderer
+
+# 快照时所有在目标之前的动画都直接跳到结束状态，不写视频、不写缓存
+SNAPSHOT_CONFIG = {
+    "skip_animations": True,
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "disable_caching": True,
+}
+
+# ============================================
+# 空跑：只推进时间和 mobject 状态，不光栅化
+# ============================================
+class DryRunRenderer(CairoRenderer):
+    # 跳过动画时 CairoRenderer 仍会为每个 play / wait 光栅化并拷贝一整帧，这里全部去掉
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def render(self, scene, time, moving_mobjects):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+
+    def freeze_current_frame(self, duration):
+        pass
+
+# ============================================
+# 跳转到指定时刻 / 检查点
+# ============================================
+class SnapshotMixin:
+    # 秒数（场景时间）、检查点名（next_section 的名字）或 "end"；
+    # 场景大多以全部淡出结束，默认取淡出前的 "final" 检查点
+    snapshot_at = "final"
+
+    def setup(self):
+        super().setup()
+        self.sections_seen = []
+
+    def play(self, *args, **kwargs):
+        animations = self.compile_animations(*args, **kwargs)
+        if isinstance(self.snapshot_at, str):
+            return super().play(*animations, **kwargs)
+
+        start = self.renderer.time
+        if start + self.get_run_time(animations) <= self.snapshot_at:
+            return super().play(*animations, **kwargs)
+
+        # 目标时刻落在这段动画里：只插值到该时刻，然后结束场景
+        self.compile_animation_data(*animations, **kwargs)
+        self.begin_animations()
+        self.update_to_time(max(self.snapshot_at - start, 0))
+        raise EndSceneEarlyException()
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        if name == self.snapshot_at:
+            raise EndSceneEarlyException()
+        self.sections_seen.append(name)
+        super().next_section(name, *args, **kwargs)
+
+
+def parse_snapshot_at(value):
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def snapshot_scene(scene_class, at="final"):
+    snapshot_class = type(scene_class.__name__, (SnapshotMixin, scene_class), {"snapshot_at": at})
+    with tempconfig(SNAPSHOT_CONFIG):
+        scene = snapshot_class(renderer=make_renderer(scene_class, renderer_class=DryRunRenderer))
+        scene.setup()
+        try:
+            scene.construct()
+        except EndSceneEarlyException:
+            return scene
+    # 检查点名写错时不要悄悄退化成最后一帧（多半是淡出后的黑屏）
+    if isinstance(at, str) and at != "end":
+        raise ValueError(
+            f"{scene_class.__name__} has no checkpoint {at!r}; "
+            f"available: {', '.join(scene.sections_seen)}, end"
+        )
+    return scene
+
+# ============================================
+# 缩略图 / 封面帧
+# ============================================
+def render_thumbnail(scene_class, at="final", path=None, **config_overrides):
+    with tempconfig(config_overrides):
+        scene = snapshot_scene(scene_class, at)
+        # 整个过程只在这里光栅化一帧
+        CairoRenderer.update_frame(scene.renderer, scene, ignore_skipping=True)
+        image = scene.renderer.camera.get_image()
+        if path is None:
+            path = Path(config.media_dir) / "thumbnails" / f"{scene_class.__name__}_{at}.png"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        image.save(path)
+    logger.info(f"Thumbnail written to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a single frame of a scene without rendering the video")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument("--at", default="final", type=parse_snapshot_at, help="seconds, section name or 'end'")
+    parser.add_argument("--quality", default="high_quality")
+    args = parser.parse_args()
+
+    for name in args.scenes:
+        render_thumbnail(load_scene(name), at=args.at, quality=args.quality)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+import argparse
+import ast
+import heapq
+import importlib
+import json
+import math
+import re
+from itertools import chain
+from pathlib import Path
+
+from manim import Scene, Wait, config, tempconfig
+
+from render_pipeline import make_renderer
+from scene_snapshot import SNAPSHOT_CONFIG, DryRunRenderer
+
+# 横幅注释里的 "# 时长: 50秒"
+DURATION_PATTERN = re.compile(r"时长[:：]\s*([\d.]+)\s*秒")
+
+# 每帧耗时的粗略模型（秒，以 1080p 为基准），可按实测渲染时间重新标定
+COST_MODEL = {
+    "frame": 0.01,    # 清屏、拷贝整帧等固定开销
+    "point": 4e-7,    # 每个贝塞尔控制点的光栅化开销
+    "encode": 0.004,  # 每帧编码
+}
+
+# ============================================
+# 空跑时记录时间线
+# ============================================
+class TimelineMixin:
+    def setup(self):
+        super().setup()
+        self.timeline = []
+
+    def play(self, *args, **kwargs):
+        animations = self.compile_animations(*args, **kwargs)
+        is_wait = len(animations) == 1 and isinstance(animations[0], Wait)
+        family = {
+            id(mob): mob for mob in chain(
+                self.get_mobject_family_members(),
+                *(animation.mobject.get_family() for animation in animations),
+            )
+        }.values()
+        self.timeline.append({
+            "start": self.renderer.time,
+            "run_time": float(self.get_run_time(animations)),
+            "kind": "wait" if is_wait else "play",
+            "animations": [type(animation).__name__ for animation in animations],
+            "mobjects": len(family),
+            "points": sum(len(mob.points) for mob in family),
+            "static": is_wait and self.is_static_wait(animations[0]),
+        })
+        super().play(*animations, **kwargs)
+
+    def is_static_wait(self, wait):
+        # 与 Scene.should_update_mobjects 同一规则：静止的 wait 只光栅化一帧，其余帧直接复制
+        if wait.is_static_wait is not None:
+            return wait.is_static_wait
+        return not (
+            self.always_update_mobjects
+            or self.updaters
+            or wait.stop_condition is not None
+            or any(mob.has_time_based_updater() for mob in self.get_mobject_family_members())
+        )
+
+
+def record_timeline(scene_class):
+    timeline_class = type(scene_class.__name__, (TimelineMixin, scene_class), {})
+    with tempconfig(SNAPSHOT_CONFIG):
+        scene = timeline_class(renderer=make_renderer(scene_class, renderer_class=DryRunRenderer))
+        scene.setup()
+        scene.construct()
+    return scene.timeline
+
+# ============================================
+# 声明时长、帧数与渲染耗时估计
+# ============================================
+def declared_durations(path):
+    source = Path(path).read_text(encoding="utf-8")
+    lines = source.splitlines()
+    declared = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        # 时长写在类定义上方的横幅里
+        for line in reversed(lines[max(node.lineno - 5, 0):node.lineno - 1]):
+            if match := DURATION_PATTERN.search(line):
+                declared[node.name] = float(match.group(1))
+                break
+    return declared
+
+
+def estimate_cost(timeline, model=COST_MODEL):
+    fps = config.frame_rate
+    pixel_scale = config.pixel_width * config.pixel_height / (1920 * 1080)
+    frames = 0
+    cost = 0.0
+    for entry in timeline:
+        if entry["static"]:
+            count = int(entry["run_time"] * fps)
+            rasterized = 1
+        else:
+            count = rasterized = math.ceil(entry["run_time"] * fps)
+        raster_cost = model["frame"] + model["point"] * entry["points"]
+        cost += (rasterized * raster_cost + count * model["encode"]) * pixel_scale
+        frames += count
+    return frames, cost
+
+
+def analyze(module="derivative_series", scene_names=(), model=COST_MODEL, tolerance=0.1):
+    module = importlib.import_module(module)
+    declared = declared_durations(module.__file__)
+    scene_classes = [
+        value for value in vars(module).values()
+        if isinstance(value, type) and issubclass(value, Scene) and value.__module__ == module.__name__
+    ]
+    if scene_names:
+        scene_classes = [cls for cls in scene_classes if cls.__name__ in scene_names]
+
+    report = []
+    for scene_class in scene_classes:
+        timeline = record_timeline(scene_class)
+        frames, cost = estimate_cost(timeline, model)
+        duration = sum(entry["run_time"] for entry in timeline)
+        expected = declared.get(scene_class.__name__)
+        report.append({
+            "scene": scene_class.__name__,
+            "duration": duration,
+            "declared": expected,
+            # 实际时长偏离横幅里的 时长 超过 tolerance（相对值）
+            "mismatch": expected is not None and abs(duration - expected) > tolerance * expected,
+            "plays": sum(entry["kind"] == "play" for entry in timeline),
+            "waits": sum(entry["kind"] == "wait" for entry in timeline),
+            "max_mobjects": max((entry["mobjects"] for entry in timeline), default=0),
+            "frames": frames,
+            "cost": cost,
+            "timeline": timeline,
+        })
+    return report
+
+# ============================================
+# 按估计耗时把场景分给多个渲染进程
+# ============================================
+def pack_scenes(costs, workers):
+    # 最长处理时间优先：每次把最贵的场景交给当前负载最小的进程
+    heap = [(0.0, index, []) for index in range(workers)]
+    for name, cost in sorted(costs.items(), key=lambda item: -item[1]):
+        load, index, names = heapq.heappop(heap)
+        names.append(name)
+        heapq.heappush(heap, (load + cost, index, names))
+    return [(load, names) for load, _, names in sorted(heap, key=lambda worker: worker[1])]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dry-run scenes to check durations and estimate render cost")
+    parser.add_argument("scenes", nargs="*")
+    parser.add_argument("--module", default="derivative_series")
+    parser.add_argument("--quality", default="high_quality")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative deviation from 时长")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+
+    with tempconfig({"quality": args.quality}):
+        report = analyze(args.module, args.scenes, tolerance=args.tolerance)
+
+    plan = pack_scenes({row["scene"]: row["cost"] for row in report}, args.workers)
+    if args.json:
+        print(json.dumps({"scenes": report, "workers": plan}, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'scene':32} {'plays':>5} {'waits':>5} {'time':>7} {'时长':>6} {'frames':>7} {'mobjects':>8} {'cost':>8}")
+        for row in report:
+            declared = row["declared"]
+            print(
+                f"{row['scene']:32} {row['plays']:5d} {row['waits']:5d} {row['duration']:6.1f}s "
+                f"{declared if declared is not None else '-':>5}s {row['frames']:7d} {row['max_mobjects']:8d} "
+                f"{row['cost']:7.1f}s" + ("  <- 时长不符" if row["mismatch"] else "")
+            )
+        print()
+        for index, (load, names) in enumerate(plan):
+            print(f"worker {index}: {load:7.1f}s  {' '.join(names)}")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import argparse
+from pathlib import Path
+
+import cairo
+from manim import ManimColor, VMobject, config, logger, tempconfig
+from manim.utils.iterables import list_update
+
+from render_pipeline import load_scene
+from scene_snapshot import parse_snapshot_at, snapshot_scene
+
+# A4 横向宽度（pt），高度按画面比例计算
+PAGE_WIDTH = 842
+
+# ============================================
+# 直接把 mobject 树画到矢量 surface 上
+# ============================================
+def draw_scene(scene, ctx, width, height):
+    camera = scene.renderer.camera
+    fw, fh = camera.frame_width, camera.frame_height
+    fc = camera.frame_center
+
+    ctx.set_source_rgba(*ManimColor(camera.background_color).to_rgb(), camera.background_opacity)
+    ctx.paint()
+    # 与 Camera.get_cairo_context 相同的坐标变换，只是目标换成页面尺寸
+    ctx.set_matrix(cairo.Matrix(
+        width / fw, 0, 0, -height / fh,
+        width / 2 - fc[0] * width / fw,
+        height / 2 + fc[1] * height / fh,
+    ))
+
+    skipped = 0
+    mobjects = camera.get_mobjects_to_display(list_update(scene.mobjects, scene.foreground_mobjects))
+    for mobject in mobjects:
+        # Tex / MathTex 本身就是编译好的 SVG 路径，直接复用
+        if isinstance(mobject, VMobject):
+            camera.display_vectorized(mobject, ctx)
+        else:
+            skipped += 1
+    if skipped:
+        logger.warning(f"{type(scene).__name__}: {skipped} non-vector mobjects were left out")
+
+
+def page_size(width=PAGE_WIDTH):
+    return width, width * config.frame_height / config.frame_width
+
+
+def export_vector(scene_class, at="final", path=None, width=PAGE_WIDTH, **config_overrides):
+    with tempconfig(config_overrides):
+        if path is None:
+            path = Path(config.media_dir) / "vector" / f"{scene_class.__name__}_{at}.svg"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        width, height = page_size(width)
+        scene = snapshot_scene(scene_class, at)
+        surface_class = cairo.PDFSurface if path.suffix == ".pdf" else cairo.SVGSurface
+        with surface_class(str(path), width, height) as surface:
+            draw_scene(scene, cairo.Context(surface), width, height)
+    logger.info(f"Vector export written to {path}")
+    return path
+
+# ============================================
+# 批量导出：多页 PDF 讲义
+# ============================================
+def export_handout(entries, path, width=PAGE_WIDTH, **config_overrides):
+    # entries: (scene_class, at) 序列；逐页写入，同一时刻只保留一个场景
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pages = 0
+    with tempconfig(config_overrides):
+        width, height = page_size(width)
+        with cairo.PDFSurface(str(path), width, height) as surface:
+            ctx = cairo.Context(surface)
+            for scene_class, at in entries:
+                ctx.save()
+                draw_scene(snapshot_scene(scene_class, at), ctx, width, height)
+                ctx.restore()
+                ctx.show_page()
+                pages += 1
+    logger.info(f"Handout with {pages} pages written to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export scene states as SVG/PDF without rasterizing")
+    parser.add_argument("scenes", nargs="+", help="SceneName or SceneName:checkpoint")
+    parser.add_argument("--at", default="final", type=parse_snapshot_at, help="default seconds, section name or 'end'")
+    parser.add_argument("--format", choices=["svg", "pdf"], help="one file per scene (default svg)")
+    parser.add_argument("--handout", help="write every scene as a page of one PDF instead")
+    args = parser.parse_args()
+    if args.handout and args.format:
+        parser.error("--format does not apply to --handout, which always writes a single PDF")
+
+    entries = []
+    for spec in args.scenes:
+        name, _, at = spec.partition(":")
+        entries.append((load_scene(name), parse_snapshot_at(at) if at else args.at))
+
+    if args.handout:
+        export_handout(entries, args.handout)
+    else:
+        for scene_class, at in entries:
+            path = Path(config.media_dir) / "vector" / f"{scene_class.__name__}_{at}.{args.format or 'svg'}"
+            export_vector(scene_class, at, path)